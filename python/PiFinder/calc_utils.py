@@ -9,10 +9,21 @@ class FastAltAz:
     http://www.stargazing.net/kepler/altaz.html
     """
 
-    def __init__(self, lat, lon, dt):
+    def __init__(self, lat, lon, dt, lst=None):
+        """
+        lst can be passed in (degrees) when a more
+        precise sidereal time is available, e.g.
+        the apparent sidereal time from skyfield
+        """
         self.lat = lat
         self.lon = lon
         self.dt = dt
+        self.sin_lat = math.sin(math.radians(lat))
+        self.cos_lat = math.cos(math.radians(lat))
+
+        if lst is not None:
+            self.local_siderial_time = lst % 360
+            return
 
         j2000 = datetime.datetime(2000, 1, 1, 12, 0, 0)
         utc_tz = pytz.timezone("UTC")
@@ -27,29 +38,48 @@ class FastAltAz:
         self.local_siderial_time = lst % 360
 
     def radec_to_altaz(self, ra, dec, alt_only=False):
-        hour_angle = (self.local_siderial_time - ra) % 360
-
-        _alt = math.sin(dec * math.pi / 180) * math.sin(
-            self.lat * math.pi / 180
-        ) + math.cos(dec * math.pi / 180) * math.cos(
-            self.lat * math.pi / 180
-        ) * math.cos(
-            hour_angle * math.pi / 180
-        )
+        hour_angle = math.radians(self.local_siderial_time - ra)
+        sin_dec = math.sin(math.radians(dec))
+        cos_dec = math.cos(math.radians(dec))
+        cos_ha = math.cos(hour_angle)
 
-        alt = math.asin(_alt) * 180 / math.pi
+        alt = math.degrees(
+            math.asin(self.sin_lat * sin_dec + self.cos_lat * cos_dec * cos_ha)
+        )
         if alt_only:
             return alt
 
-        _az = (
-            math.sin(dec * math.pi / 180)
-            - math.sin(alt * math.pi / 180) * math.sin(self.lat * math.pi / 180)
-        ) / (math.cos(alt * math.pi / 180) * math.cos(self.lat * math.pi / 180))
+        az = math.degrees(
+            math.atan2(
+                -cos_dec * math.sin(hour_angle),
+                sin_dec * self.cos_lat - cos_dec * cos_ha * self.sin_lat,
+            )
+        )
+        return alt, az % 360
+
+
+def refraction(alt, pressure_mbar=1010.0, temperature_C=10.0):
+    """
+    Estimated atmospheric refraction in degrees
+    for an observed altitude.  Same formula as
+    skyfield's earthlib.refraction
+    """
+    if alt < -1.0 or alt > 89.9:
+        return 0.0
+    r = 0.016667 / math.tan(math.radians(alt + 7.31 / (alt + 4.4)))
+    return r * (0.28 * pressure_mbar / (temperature_C + 273.0))
 
-        _az = math.acos(_az) * 180 / math.pi
 
-        if math.sin(hour_angle * math.pi / 180) < 0:
-            az = _az
-        else:
-            az = 360 - _az
-        return alt, az
+def refract(alt, pressure_mbar=1010.0, temperature_C=10.0):
+    """
+    Returns where a geometric altitude will
+    appear in the sky, iterating the same way
+    as skyfield's earthlib.refract so results
+    match skyfield's refracted altaz
+    """
+    apparent_alt = alt
+    while True:
+        previous_alt = apparent_alt
+        apparent_alt = alt + refraction(previous_alt, pressure_mbar, temperature_C)
+        if abs(apparent_alt - previous_alt) <= 3.0e-5:
+            return apparent_alt
@@ -25,12 +25,13 @@ def get_ngc_aka(catalog_object):
     db_c = conn.cursor()
 
     aka_rec = conn.execute(
-        f"""
+        """
         SELECT common_name from names
-        where catalog = "{catalog_object['catalog']}"
-        and sequence = "{catalog_object['sequence']}"
+        where catalog = :catalog
+        and sequence = :sequence
         and common_name like "NGC%"
-    """
+    """,
+        {"catalog": catalog_object["catalog"], "sequence": catalog_object["sequence"]},
     ).fetchone()
     return aka_rec
 
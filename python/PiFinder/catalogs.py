@@ -1,6 +1,7 @@
 import logging
 import sqlite3
 import time
+import bisect
 import numpy as np
 import pandas as pd
 from typing import List, Dict, Optional
@@ -41,17 +42,19 @@ class Catalog:
         self.conn = sqlite3.connect(utils.pifinder_db)
         self.conn.row_factory = sqlite3.Row
         cat_objects = self.conn.execute(
-            f"""
+            """
             SELECT * from objects
-            where catalog='{self.name}'
+            where catalog = :catalog
             order by sequence
-        """
+        """,
+            {"catalog": self.name},
         ).fetchall()
         cat_data = self.conn.execute(
-            f"""
-                SELECT * from catalogs
-                where catalog='{self.name}'
             """
+                SELECT * from catalogs
+                where catalog = :catalog
+            """,
+            {"catalog": self.name},
         ).fetchone()
         print(cat_data)
         if cat_data:
@@ -264,8 +267,12 @@ class CatalogTracker:
             designator.set_number(next_key)
 
         else:
-            current_index = keys_sorted.index(current_key)
-            next_index = current_index + direction
+            # keys are sorted, so bisect for the neighbour.  This also
+            # works if the current object has been filtered out
+            if direction == 1:
+                next_index = bisect.bisect_right(keys_sorted, current_key)
+            else:
+                next_index = bisect.bisect_left(keys_sorted, current_key) - 1
             if next_index == -1 or next_index >= len(keys_sorted):
                 next_key = None  # hack to get around the fact that 0 is a valid key
                 designator.set_number(0)  # todo use -1 in designator as well
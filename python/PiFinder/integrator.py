@@ -92,6 +92,30 @@ class Skyfield_utils:
             alt, az, distance = apparent.altaz()
         return alt.degrees, az.degrees
 
+    def radec_to_apparent_radec(self, ra, dec, dt):
+        """
+        returns the geocentric apparent ra/dec
+        (equinox of date) of a J2000 ra/dec at the
+        given time.  ra/dec can be numpy arrays
+        """
+        t = self.ts.from_datetime(dt)
+        sky_pos = Star(
+            ra=Angle(degrees=ra),
+            dec_degrees=dec,
+        )
+
+        apparent = self.earth.at(t).observe(sky_pos).apparent()
+        ra, dec, distance = apparent.radec(epoch=t)
+        return ra._degrees, dec._degrees
+
+    def local_apparent_sidereal_time(self, dt, lon):
+        """
+        returns the local apparent sidereal
+        time in degrees
+        """
+        t = self.ts.from_datetime(dt)
+        return (t.gast * 15 + lon) % 360
+
     def radec_to_constellation(self, ra, dec):
         """
         Take a ra/dec and return the constellation
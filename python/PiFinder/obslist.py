@@ -10,6 +10,8 @@ tools
 """
 import os
 import sqlite3
+import functools
+import numpy as np
 from textwrap import dedent
 from PiFinder import utils
 
@@ -24,28 +26,61 @@ SKYSAFARI_CATALOG_NAMES = {
 SKYSAFARI_CATALOG_NAMES_INV = {v: k for k, v in SKYSAFARI_CATALOG_NAMES.items()}
 
 
+class ObsList:
+    """
+    Struct of arrays view of the ra/dec of a
+    catalog (list of object records) so they
+    can be used with numpy/numba without per
+    object dict lookups
+    """
+
+    ra: np.ndarray
+    dec: np.ndarray
+
+    def __init__(self, catalog):
+        self.ra = np.array([obj["ra"] for obj in catalog], dtype=np.float64)
+        self.dec = np.array([obj["dec"] for obj in catalog], dtype=np.float64)
+        self._indexes = {id(obj): i for i, obj in enumerate(catalog)}
+
+    def __len__(self):
+        return len(self.ra)
+
+    def index(self, obj):
+        """
+        Returns the index of this exact
+        object record or None
+        """
+        return self._indexes.get(id(obj))
+
+
 def write_list(catalog, name):
     """
     Writes the catalog (list of object records)
     to a file.
     """
-    index_num = 0
-    with open(OBSLIST_DIR + name + ".skylist", "w") as skylist:
-        skylist.write("SkySafariObservingListVersion=3.0\n")
-        for obj in catalog:
-            catalog_name = SKYSAFARI_CATALOG_NAMES.get(obj["catalog"], obj["catalog"])
-            catalog_number = f"{catalog_name} {obj['sequence']}"
-            entry_text = dedent(
-                f"""
-                SkyObject=BeginObject
-                    ObjectID=4,-1,-1
-                    CatalogNumber={catalog_number}
-                    DefaultIndex={index_num}
-                EndObject=SkyObject
-                """
-            ).strip()
-            skylist.write(entry_text + "\n")
-            index_num += 1
+    entries = ["SkySafariObservingListVersion=3.0\n"]
+    for index_num, obj in enumerate(catalog):
+        catalog_name = SKYSAFARI_CATALOG_NAMES.get(obj["catalog"], obj["catalog"])
+        catalog_number = f"{catalog_name} {obj['sequence']}"
+        entry_text = dedent(
+            f"""
+            SkyObject=BeginObject
+                ObjectID=4,-1,-1
+                CatalogNumber={catalog_number}
+                DefaultIndex={index_num}
+            EndObject=SkyObject
+            """
+        ).strip()
+        entries.append(entry_text + "\n")
+
+    # build the whole file and write / sync it once
+    with open(OBSLIST_DIR + name + ".skylist", "w", buffering=1 << 20) as skylist:
+        skylist.write("".join(entries))
+        skylist.flush()
+        os.fsync(skylist.fileno())
+
+    # in case the directory mtime has not ticked over
+    _get_lists.cache_clear()
 
 
 def resolve_object(catalog_numbers, connection):
@@ -64,13 +99,13 @@ def resolve_object(catalog_numbers, connection):
             return None
 
         _object = connection.execute(
-            f"""
+            """
                     select * from
                     objects
-                    where catalog='{catalog}'
-                    and sequence={sequence}
-
-                """
+                    where catalog = :catalog
+                    and sequence = :sequence
+                """,
+            {"catalog": catalog, "sequence": sequence},
         ).fetchone()
         if _object:
             return dict(_object)
@@ -164,9 +199,19 @@ def get_lists():
     """
     Returns a list of list names on disk
     """
+    return list(_get_lists(os.stat(OBSLIST_DIR).st_mtime_ns))
+
+
+@functools.lru_cache(maxsize=1)
+def _get_lists(dir_mtime_ns):
+    """
+    Scans the list directory, cached on
+    the directory mtime so the scan only
+    happens when files are added/removed
+    """
     obs_files = []
     for filename in os.listdir(OBSLIST_DIR):
         if not filename.startswith(".") and filename.endswith(".skylist"):
             obs_files.append(filename[:-8])
 
-    return obs_files
+    return tuple(obs_files)
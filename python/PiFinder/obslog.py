@@ -141,12 +141,13 @@ def get_logs_for_object(obj_record):
     conn, db_c = get_observations_database()
 
     logs = db_c.execute(
-        f"""
+        """
             select * from obs_objects
             where
-                catalog="{obj_record['catalog']}"
-                and sequence={obj_record['sequence']}
-            """
+                catalog = :catalog
+                and sequence = :sequence
+            """,
+        {"catalog": obj_record["catalog"], "sequence": obj_record["sequence"]},
     ).fetchall()
 
     return logs
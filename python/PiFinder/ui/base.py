@@ -19,6 +19,9 @@ class UIModule:
     __title__ = "BASE"
     __uuid__ = str(uuid.uuid1()).split("-")[0]
     _config_options = None
+    # (module id, screen hash) of the last frame sent
+    # to the display, shared by all modules
+    _last_displayed = None
 
     def __init__(
         self,
@@ -38,9 +41,15 @@ class UIModule:
         self.command_queues = command_queues
         self.screen = Image.new("RGB", (128, 128))
         self.draw = ImageDraw.Draw(self.screen)
+        # Pasted to clear the screen / title strip
+        self._blank = Image.new("RGB", (128, 128), self.colors.get(0))
+        self._blank_title = Image.new("RGB", (128, 17), self.colors.get(0))
+        # RGB displays can take self.screen as is
+        self._needs_convert = self.display.mode != "RGB"
         self.font_base = fonts.base
         self.font_bold = fonts.bold
         self.font_large = fonts.large
+        self._title_tiles = {}
 
         # screenshot stuff
         root_dir = str(utils.data_dir)
@@ -79,6 +88,15 @@ class UIModule:
             "options"
         ][current_index]
 
+    def _screen_for_display(self):
+        """
+        Returns self.screen in the display's
+        mode
+        """
+        if not self._needs_convert:
+            return self.screen
+        return self.screen.convert(self.display.mode)
+
     def screengrab(self):
         self.ss_count += 1
         ss_imagepath = self.ss_path + f"_{self.ss_count :0>3}.png"
@@ -127,9 +145,26 @@ class UIModule:
         )
         message = " " * int((16 - len(message)) / 2) + message
         self.draw.text((9, 54), message, font=self.font_bold, fill=self.colors.get(255))
-        self.display.display(self.screen.convert(self.display.mode))
+        self.display.display(self._screen_for_display())
+        UIModule._last_displayed = None
         self.ui_state["message_timeout"] = timeout + time.time()
 
+    def _title_tile(self, title):
+        """
+        Returns the title bar background
+        with the title text rendered on it.
+        Cached per title so the glyphs are
+        only rasterized once
+        """
+        tile = self._title_tiles.get(title)
+        if tile is None:
+            tile = Image.new("RGB", (128, 17), self.colors.get(64))
+            ImageDraw.Draw(tile).text(
+                (6, 1), title, font=self.font_bold, fill=self.colors.get(0)
+            )
+            self._title_tiles[title] = tile
+        return tile
+
     def screen_update(self, title_bar=True):
         """
         called to trigger UI updates
@@ -140,10 +175,7 @@ class UIModule:
             return None
 
         if title_bar:
-            self.draw.rectangle([0, 0, 128, 16], fill=self.colors.get(64))
-            self.draw.text(
-                (6, 1), self.title, font=self.font_bold, fill=self.colors.get(0)
-            )
+            self.screen.paste(self._title_tile(self.title))
             if self.shared_state:
                 if self.shared_state.solve_state():
                     solution = self.shared_state.solution()
@@ -184,10 +216,15 @@ class UIModule:
                 self.draw.rectangle([100, 2, 110, 14], fill=bg)
                 self.draw.text((102, 0), "G", font=self.font_bold, fill=fg)
 
-        screen_to_display = self.screen.convert(self.display.mode)
-        self.display.display(screen_to_display)
-        if self.shared_state:
-            self.shared_state.set_screen(screen_to_display)
+        # Skip the display transfer if this module
+        # already sent this exact frame
+        display_key = (id(self), hash(self.screen.tobytes()))
+        if display_key != UIModule._last_displayed:
+            screen_to_display = self._screen_for_display()
+            self.display.display(screen_to_display)
+            if self.shared_state:
+                self.shared_state.set_screen(screen_to_display)
+            UIModule._last_displayed = display_key
 
         # We can return a UIModule class name to force a switch here
         tmp_return = self.switch_to
@@ -109,6 +109,7 @@ class UICatalog(UIModule):
         )
         self.conn = sqlite3.connect(utils.pifinder_db)
         self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA query_only=1")
         self.font_large = fonts.large
 
         self.object_display_mode = DM_DESC
@@ -242,11 +243,12 @@ class UICatalog(UIModule):
             # text stuff....
             # look for AKAs
             aka_recs = self.conn.execute(
-                f"""
+                """
                 SELECT * from names
-                where catalog = "{cat_object['catalog']}"
-                and sequence = "{cat_object['sequence']}"
-            """
+                where catalog = :catalog
+                and sequence = :sequence
+            """,
+                {"catalog": cat_object["catalog"], "sequence": cat_object["sequence"]},
             ).fetchall()
 
             self.texts = {}
@@ -344,7 +346,7 @@ class UICatalog(UIModule):
 
     def update(self, force=True):
         # Clear Screen
-        self.draw.rectangle([0, 0, 128, 128], fill=self.colors.get(0))
+        self.screen.paste(self._blank)
         cat_object = self.catalog_tracker.get_current_object()
 
         if self.object_display_mode in [DM_DESC, DM_OBS] or cat_object is None:
@@ -498,6 +500,10 @@ class UICatalog(UIModule):
                 self.ui_state["history_list"].append(self.ui_state["target"])
             elif self.ui_state["history_list"][-1] != self.ui_state["target"]:
                 self.ui_state["history_list"].append(self.ui_state["target"])
+            else:
+                # keep the target the same object as the
+                # history entry so UILocate can find it
+                self.ui_state["target"] = self.ui_state["history_list"][-1]
 
             self.ui_state["active_list"] = self.ui_state["history_list"]
             self.switch_to = "UILocate"
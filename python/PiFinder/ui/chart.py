@@ -166,7 +166,7 @@ class UIChart(UIModule):
                 self.last_update = last_solve_time
 
         else:
-            self.draw.rectangle([0, 0, 128, 128], fill=self.colors.get(0))
+            self.screen.paste(self._blank)
             self.draw.text(
                 (18, 20), "Can't plot", font=self.font_large, fill=self.colors.get(255)
             )
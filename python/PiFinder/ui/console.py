@@ -5,7 +5,10 @@ This module contains all the UI Module classes
 
 """
 import os
+import time
 import datetime
+import itertools
+from collections import deque
 
 from PIL import Image
 from PiFinder.ui.base import UIModule
@@ -29,7 +32,11 @@ class UIConsole(UIModule):
         welcome_image = convert_image_to_mode(welcome_image, self.colors.mode)
         self.screen.paste(welcome_image)
 
-        self.lines = ["---- TOP ---", "Sess UUID:" + self.__uuid__]
+        self.lines = deque(["---- TOP ---", "Sess UUID:" + self.__uuid__], maxlen=512)
+        # writes are batched here and flushed
+        # to lines at most every 100ms
+        self._pending = []
+        self._last_flush = 0
         self.scroll_offset = 0
         self.debug_mode = False
 
@@ -67,7 +74,18 @@ class UIConsole(UIModule):
         Writes a new line to the console.
         """
         print(f"Write: {line}")
-        self.lines.append(line)
+        self._pending.append(line)
+        if time.time() - self._last_flush > 0.1:
+            self.flush()
+
+    def flush(self):
+        """
+        Moves pending writes to the
+        console lines
+        """
+        self.lines.extend(self._pending)
+        self._pending = []
+        self._last_flush = time.time()
         # reset scroll offset
         self.scroll_offset = 0
         self.dirty = True
@@ -78,10 +96,12 @@ class UIConsole(UIModule):
         self.update()
 
     def update(self, force=False):
+        if self._pending:
+            self.flush()
         if self.dirty:
             if self.welcome:
                 # Clear / write just top line
-                self.draw.rectangle([0, 0, 128, 16], fill=self.colors.get(0))
+                self.screen.paste(self._blank_title)
                 self.draw.text(
                     (0, 1),
                     self.lines[-1],
@@ -91,8 +111,12 @@ class UIConsole(UIModule):
                 return self.screen_update(title_bar=False)
             else:
                 # clear screen
-                self.draw.rectangle([0, 0, 128, 128], fill=self.colors.get(0))
-                for i, line in enumerate(self.lines[-10 - self.scroll_offset :][:10]):
+                self.screen.paste(self._blank)
+                scroll_offset = min(self.scroll_offset, max(len(self.lines) - 10, 0))
+                lines = itertools.islice(
+                    reversed(self.lines), scroll_offset, scroll_offset + 10
+                )
+                for i, line in enumerate(list(lines)[::-1]):
                     self.draw.text(
                         (0, i * 10 + 20),
                         line,
@@ -5,15 +5,58 @@ This module contains the Locate module
 
 """
 import time
-from PIL import ImageFont
+import math
+from PIL import Image, ImageDraw, ImageFont
 import logging
+import numpy as np
+from numba import njit
 
-from PiFinder import integrator, obslist, config
+from PiFinder import calc_utils, integrator, obslist, config
 from PiFinder.obj_types import OBJ_TYPES
 from PiFinder.ui.base import UIModule
 from PiFinder.ui.fonts import Fonts as fonts
 
 
+@njit(fastmath=True, cache=True)
+def _altaz_kernel(ra, dec, lst, sin_lat, cos_lat, out_alt, out_az):
+    """
+    Fills out_alt/out_az for arrays of
+    ra/dec at the given local sidereal
+    time, all in degrees.  Same math as
+    calc_utils.FastAltAz.radec_to_altaz
+    """
+    for i in range(len(ra)):
+        ha = np.radians(lst - ra[i])
+        sin_dec = np.sin(np.radians(dec[i]))
+        cos_dec = np.cos(np.radians(dec[i]))
+        cos_ha = np.cos(ha)
+        out_alt[i] = np.degrees(
+            np.arcsin(sin_lat * sin_dec + cos_lat * cos_dec * cos_ha)
+        )
+        out_az[i] = (
+            np.degrees(
+                np.arctan2(
+                    -cos_dec * np.sin(ha),
+                    sin_dec * cos_lat - cos_dec * cos_ha * sin_lat,
+                )
+            )
+            % 360
+        )
+
+
+# Warm up the JIT so the first keypress
+# does not wait on compilation
+_altaz_kernel(
+    np.zeros(2),
+    np.zeros(2),
+    0.0,
+    0.0,
+    1.0,
+    np.empty(2),
+    np.empty(2),
+)
+
+
 class UILocate(UIModule):
     """
     Display pushto info
@@ -40,15 +83,70 @@ class UILocate(UIModule):
         super().__init__(*args)
         self.target_index = None
         self.object_text = ["No Object Found"]
+        self._object_text_target = None
         self.__catalog_names = self.config_object.get_option("catalogs")
-        self.sf_utils = integrator.Skyfield_utils()
+        self.sf_utils = integrator.sf_utils
+        self._fast_aa = None
+        self._fast_aa_key = None
+        self._pressure_mbar = 1010.0
+        self._target_apparent = (None, None, None)
+        self._obs = obslist.ObsList([])
+        self._app_ra = None
+        self._app_dec = None
+        self._alt_buf = np.empty(0, dtype=np.float64)
+        self._az_buf = np.empty(0, dtype=np.float64)
+        self._altaz_arr_key = None
         self.font_huge = fonts.huge
+        self._build_huge_glyphs()
+        self._build_arrows()
         self.screen_direction = config.Config().get_option("screen_direction")
 
         available_lists = obslist.get_lists()
         self._config_options["Load"]["options"] += available_lists
         self.obs_list_write_index = 0
         self.last_update_time = time.time()
+        self._static_key = None
+        self._static_drawn_time = 0
+        self._last_az_str = None
+        self._last_alt_str = None
+
+    def _build_huge_glyphs(self):
+        """
+        Pre-renders the characters used in the
+        big az/alt readout as masks so they can
+        be pasted instead of rasterized every frame
+        """
+        self._huge_width = int(self.font_huge.getlength("0"))
+        ascent, descent = self.font_huge.getmetrics()
+        self._huge_glyphs = {}
+        for ch in "0123456789.-":
+            glyph = Image.new("L", (self._huge_width, ascent + descent))
+            ImageDraw.Draw(glyph).text((0, 0), ch, font=self.font_huge, fill=255)
+            self._huge_glyphs[ch] = glyph
+
+    def _build_arrows(self):
+        """
+        Pre-renders the pointing arrow
+        triangles for each rotation
+        """
+        self._arrows = {}
+        for angle in [0, 90, 180, 270]:
+            arrow = Image.new("RGB", (21, 21), self.colors.get(0))
+            ImageDraw.Draw(arrow).regular_polygon(
+                (10, 10, 10), 3, angle, fill=self.colors.get(255)
+            )
+            self._arrows[angle] = arrow
+
+    def _draw_huge(self, xy, text):
+        """
+        Draws text using the pre-rendered
+        huge glyphs
+        """
+        x, y = xy
+        for ch in text:
+            if ch != " ":
+                self.screen.paste(self.colors.get(255), (x, y), self._huge_glyphs[ch])
+            x += self._huge_width
 
     def save_list(self, option):
         self._config_options["Load"]["value"] = ""
@@ -85,6 +183,7 @@ class UILocate(UIModule):
 
         self.ui_state["observing_list"] = _load_results["catalog"]
         self.ui_state["active_list"] = self.ui_state["observing_list"]
+        self._load_list_arrays()
         self.target_index = 0
         self.ui_state["target"] = self.ui_state["active_list"][self.target_index]
         self.update_object_text()
@@ -109,6 +208,7 @@ class UILocate(UIModule):
             else:
                 self.message("No History", 1)
 
+        self._load_list_arrays()
         if self.target_index != None:
             self.ui_state["target"] = self.ui_state["active_list"][self.target_index]
             self.update_object_text()
@@ -130,6 +230,7 @@ class UILocate(UIModule):
         active_list = self.ui_state["active_list"]
         if self.target_index is not None and len(active_list) > 1:
             del active_list[self.target_index]
+            self._load_list_arrays()
             self.target_index = (self.target_index + 1) % len(active_list)
             self.target = self.ui_state["active_list"][self.target_index]
             self.ui_state["target"] = self.target
@@ -147,6 +248,12 @@ class UILocate(UIModule):
         """
         Generates object text
         """
+        # The text only depends on the target, so
+        # skip regenerating it for the same target
+        if self.ui_state["target"] is self._object_text_target:
+            return
+        self._object_text_target = self.ui_state["target"]
+
         if not self.ui_state["target"]:
             self.object_text = ["No Object Found"]
             return
@@ -165,6 +272,94 @@ class UILocate(UIModule):
                 f"Error generating object text: {e}, {self.ui_state['target']}"
             )
 
+    def _load_list_arrays(self):
+        """
+        Builds the struct of arrays view of
+        the active list so alt/az can be
+        computed for all targets in one pass
+        """
+        self._obs = obslist.ObsList(self.ui_state["active_list"])
+        self._app_ra = None
+        self._app_dec = None
+        self._alt_buf = np.empty(len(self._obs), dtype=np.float64)
+        self._az_buf = np.empty(len(self._obs), dtype=np.float64)
+        self._altaz_arr_key = None
+
+    def _update_altaz_arrays(self, dt):
+        """
+        Recomputes geometric alt/az for every
+        target in the active list, at most once
+        per sidereal time update
+        """
+        if self._app_ra is None:
+            # Apparent places drift by well under an arcsecond
+            # an hour, so computing them once per list is enough
+            self._app_ra, self._app_dec = self.sf_utils.radec_to_apparent_radec(
+                self._obs.ra, self._obs.dec, dt
+            )
+            self._altaz_arr_key = None
+
+        if self._fast_aa_key == self._altaz_arr_key:
+            return
+
+        _altaz_kernel(
+            self._app_ra,
+            self._app_dec,
+            self._fast_aa.local_siderial_time,
+            self._fast_aa.sin_lat,
+            self._fast_aa.cos_lat,
+            self._alt_buf,
+            self._az_buf,
+        )
+        self._altaz_arr_key = self._fast_aa_key
+
+    def _update_fast_aa(self, location, dt):
+        """
+        Rebuilds the FastAltAz for this location
+        using skyfield's apparent sidereal time,
+        at most once per second
+        """
+        fast_aa_key = (
+            location["lat"],
+            location["lon"],
+            location["altitude"],
+            dt.replace(microsecond=0),
+        )
+        if fast_aa_key != self._fast_aa_key:
+            self._fast_aa = calc_utils.FastAltAz(
+                location["lat"],
+                location["lon"],
+                dt,
+                lst=self.sf_utils.local_apparent_sidereal_time(dt, location["lon"]),
+            )
+            # skyfield's 'standard' pressure for this elevation
+            self._pressure_mbar = 1010.0 * math.exp(-location["altitude"] / 9.1e3)
+            self._fast_aa_key = fast_aa_key
+
+    def _target_altaz(self, dt):
+        """
+        Returns the refracted alt/az of the target.
+        Matches skyfield's apparent altaz("standard")
+        which the solution alt/az come from
+        """
+        if self.target_index is not None:
+            self._update_altaz_arrays(dt)
+            target_alt = self._alt_buf[self.target_index]
+            target_az = self._az_buf[self.target_index]
+        else:
+            target = self.ui_state["target"]
+            if self._target_apparent[0] is not target:
+                self._target_apparent = (
+                    target,
+                    *self.sf_utils.radec_to_apparent_radec(
+                        target["ra"], target["dec"], dt
+                    ),
+                )
+            target_alt, target_az = self._fast_aa.radec_to_altaz(
+                self._target_apparent[1], self._target_apparent[2]
+            )
+        return calc_utils.refract(target_alt, self._pressure_mbar), target_az
+
     def aim_degrees(self):
         """
         Returns degrees in
@@ -177,41 +372,35 @@ class UILocate(UIModule):
         if location and dt and solution:
             if solution["Alt"]:
                 # We have position and time/date!
-                self.sf_utils.set_location(
-                    location["lat"],
-                    location["lon"],
-                    location["altitude"],
-                )
-                target_alt, target_az = self.sf_utils.radec_to_altaz(
-                    self.ui_state["target"]["ra"],
-                    self.ui_state["target"]["dec"],
-                    dt,
-                )
-                az_diff = target_az - solution["Az"]
-                az_diff = (az_diff + 180) % 360 - 180
+                self._update_fast_aa(location, dt)
+                target_alt, target_az = self._target_altaz(dt)
+                # Wrap to -180..180. The IMU updated solution
+                # alt is kept modulo 360, so alt needs this too
+                az_diff = math.remainder(target_az - solution["Az"], 360.0)
                 if self.screen_direction == "flat":
                     az_diff *= -1
 
-                alt_diff = target_alt - solution["Alt"]
-                alt_diff = (alt_diff + 180) % 360 - 180
+                alt_diff = math.remainder(target_alt - solution["Alt"], 360.0)
 
                 return az_diff, alt_diff
         return None, None
 
     def active(self):
-        try:
-            self.target_index = self.ui_state["active_list"].index(
-                self.ui_state["target"]
-            )
-        except ValueError:
-            self.target_index = None
+        # active list may have changed while
+        # another module was in the foreground
+        self._load_list_arrays()
+        self.target_index = self._obs.index(self.ui_state["target"])
         self.update_object_text()
-        self.update()
+        self.update(force=True)
 
-    def update(self, force=False):
-        time.sleep(1 / 30)
+    def _draw_static(self):
+        """
+        Draws the target name, list position
+        and object text.  These only change
+        with the target
+        """
         # Clear Screen
-        self.draw.rectangle([0, 0, 128, 128], fill=self.colors.get(0))
+        self.screen.paste(self._blank)
 
         if not self.ui_state["target"]:
             self.draw.text(
@@ -220,7 +409,7 @@ class UILocate(UIModule):
                 font=self.font_large,
                 fill=self.colors.get(255),
             )
-            return self.screen_update()
+            return
 
         # Target Name
         line = self.ui_state["target"].get("catalog", "ERR")
@@ -250,56 +439,87 @@ class UILocate(UIModule):
             (0, 40), self.object_text[0], font=self.font_bold, fill=self.colors.get(255)
         )
 
+    def _draw_dynamic(self, point_az, point_alt):
+        """
+        Draws the pointing arrows and degrees
+        """
+        # Clear everything below the ID line
+        self.draw.rectangle([0, 57, 128, 128], fill=self.colors.get(0))
+
         # Pointing Instructions
-        point_az, point_alt = self.aim_degrees()
         if not point_az:
-            self.draw.text(
-                (0, 50), " ---.-", font=self.font_huge, fill=self.colors.get(255)
-            )
-            self.draw.text(
-                (0, 84), "  --.-", font=self.font_huge, fill=self.colors.get(255)
-            )
+            self._draw_huge((0, 50), " ---.-")
+            self._draw_huge((0, 84), "  --.-")
         else:
             if point_az >= 0:
-                self.draw.regular_polygon(
-                    (10, 75, 10), 3, 90, fill=self.colors.get(255)
-                )
+                self.screen.paste(self._arrows[90], (0, 65))
                 # self.draw.pieslice([-20,65,20,85],330, 30, fill=self.colors.get(255))
                 # self.draw.text((0, 50), "+", font=self.font_huge, fill=self.colors.get(255))
             else:
                 point_az *= -1
-                self.draw.regular_polygon(
-                    (10, 75, 10), 3, 270, fill=self.colors.get(255)
-                )
+                self.screen.paste(self._arrows[270], (0, 65))
                 # self.draw.pieslice([0,65,40,85],150,210, fill=self.colors.get(255))
                 # self.draw.text((0, 50), "-", font=self.font_huge, fill=self.colors.get(255))
-            self.draw.text(
-                (25, 50),
-                f"{point_az : >5.1f}",
-                font=self.font_huge,
-                fill=self.colors.get(255),
-            )
+            self._draw_huge((25, 50), f"{point_az : >5.1f}")
 
             if point_alt >= 0:
-                self.draw.regular_polygon(
-                    (10, 110, 10), 3, 0, fill=self.colors.get(255)
-                )
+                self.screen.paste(self._arrows[0], (0, 100))
                 # self.draw.pieslice([0,84,20,124],60, 120, fill=self.colors.get(255))
                 # self.draw.text((0, 84), "+", font=self.font_huge, fill=self.colors.get(255))
             else:
                 point_alt *= -1
-                self.draw.regular_polygon(
-                    (10, 105, 10), 3, 180, fill=self.colors.get(255)
-                )
+                self.screen.paste(self._arrows[180], (0, 95))
                 # self.draw.pieslice([0,104,20,144],270, 330, fill=self.colors.get(255))
                 # self.draw.text((0, 84), "-", font=self.font_huge, fill=self.colors.get(255))
-            self.draw.text(
-                (25, 84),
-                f"{point_alt : >5.1f}",
-                font=self.font_huge,
-                fill=self.colors.get(255),
-            )
+            self._draw_huge((25, 84), f"{point_alt : >5.1f}")
+
+    def update(self, force=False):
+        time.sleep(1 / 30)
 
+        # Only redraw the top of the screen when the target
+        # changes or a message box has been drawn over it
+        static_key = (
+            id(self.ui_state["target"]),
+            self.target_index,
+            len(self.ui_state["active_list"]),
+            self.ui_state["active_list"] == self.ui_state["history_list"],
+        )
+        if (
+            force
+            or static_key != self._static_key
+            or self.ui_state["message_timeout"] > self._static_drawn_time
+        ):
+            self._draw_static()
+            self._static_key = static_key
+            self._static_drawn_time = time.time()
+            self._last_az_str = None
+            self._last_alt_str = None
+
+        if not self.ui_state["target"]:
+            return self.screen_update()
+
+        point_az, point_alt = self.aim_degrees()
+        if not point_az:
+            az_str, alt_str = " ---.-", "  --.-"
+        else:
+            az_str, alt_str = f"{point_az : >5.1f}", f"{point_alt : >5.1f}"
+
+        # Nothing changed, skip the redraw but still refresh
+        # the title bar status once a second
+        if (
+            az_str == self._last_az_str
+            and alt_str == self._last_alt_str
+            and self.switch_to is None
+            and time.time() - self.last_update_time < 1
+        ):
+            return None
+
+        if az_str != self._last_az_str or alt_str != self._last_alt_str:
+            self._draw_dynamic(point_az, point_alt)
+            self._last_az_str = az_str
+            self._last_alt_str = alt_str
+
+        self.last_update_time = time.time()
         return self.screen_update()
 
     def scroll_target_history(self, direction):
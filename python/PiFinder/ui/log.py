@@ -145,7 +145,7 @@ class UILog(UIModule):
 
     def update(self, force=False):
         # Clear Screen
-        self.draw.rectangle([0, 0, 128, 128], fill=self.colors.get(0))
+        self.screen.paste(self._blank)
 
         if self.modal_text:
             if time.time() - self.modal_timer > self.modal_duration:
@@ -7,7 +7,9 @@ This module contains all the UI Module classes
 import uuid
 import os
 import time
-from PIL import Image, ImageDraw, ImageFont, ImageChops, ImageOps
+import numpy as np
+from numba import njit
+from PIL import Image, ImageDraw, ImageFont
 
 from PiFinder.image_util import (
     gamma_correct_high,
@@ -18,6 +20,67 @@ from PiFinder.image_util import (
 from PiFinder.ui.base import UIModule
 
 
+# 256 entry lookup tables for each Gamma Adj option
+GAMMA_LUTS = {
+    "Off": np.arange(256, dtype=np.uint8),
+    "Low": np.array([gamma_correct_low(i) for i in range(256)], dtype=np.uint8),
+    "Med": np.array([gamma_correct_med(i) for i in range(256)], dtype=np.uint8),
+    "High": np.array([gamma_correct_high(i) for i in range(256)], dtype=np.uint8),
+}
+
+
+@njit(cache=True)
+def _preview_pipeline(gray, color_mask, gamma_lut, out_rgb):
+    """
+    Fused clip -> colour mask -> autocontrast -> gamma
+    for the preview image.  Fills out_rgb in place
+    from the 2d float array gray
+    """
+    rows, cols = gray.shape
+
+    # scan for the autocontrast range
+    lo = 255
+    hi = 0
+    for y in range(rows):
+        for x in range(cols):
+            v = min(max(int(gray[y, x]), 0), 255)
+            lo = min(lo, v)
+            hi = max(hi, v)
+
+    if hi > lo:
+        scale = 255.0 / (hi - lo)
+    else:
+        lo = 0
+        scale = 1.0
+
+    for y in range(rows):
+        for x in range(cols):
+            v = min(max(int(gray[y, x]), 0), 255)
+            v = min(max(int((v - lo) * scale), 0), 255)
+            v = gamma_lut[v]
+            for c in range(3):
+                out_rgb[y, x, c] = v * color_mask[c]
+
+
+# Warm up the JIT so the first preview frame
+# does not wait on compilation.  Background subtracted
+# frames arrive as read only arrays, so warm up both
+_warmup_gray = np.zeros((2, 2), dtype=np.float32)
+_preview_pipeline(
+    _warmup_gray,
+    np.ones(3, dtype=np.uint8),
+    GAMMA_LUTS["Off"],
+    np.empty((2, 2, 3), dtype=np.uint8),
+)
+_warmup_gray.setflags(write=False)
+_preview_pipeline(
+    _warmup_gray,
+    np.ones(3, dtype=np.uint8),
+    GAMMA_LUTS["Off"],
+    np.empty((2, 2, 3), dtype=np.uint8),
+)
+
+
 class UIPreview(UIModule):
     __title__ = "PREVIEW"
     _config_options = {
@@ -79,6 +142,9 @@ class UIPreview(UIModule):
         self.capture_prefix = f"{self.__uuid__}_diag"
         self.capture_count = 0
 
+        self._color_mask = self.colors.color_mask.astype(np.uint8)
+        self._preview_rgb = np.empty((128, 128, 3), dtype=np.uint8)
+
     def set_exp(self, option):
         new_exposure = int(option * 1000000)
         self.command_queues["camera"].put(f"set_exp:{new_exposure}")
@@ -140,18 +206,16 @@ class UIPreview(UIModule):
                 image_obj = image_obj.crop((192, 192, 320, 320))
             if self._config_options["BG Sub"]["value"] == "On":
                 image_obj = subtract_background(image_obj)
-            image_obj = image_obj.convert("RGB")
-            image_obj = ImageChops.multiply(image_obj, self.colors.red_image)
-            image_obj = ImageOps.autocontrast(image_obj)
-
-            if self._config_options["Gamma Adj"]["value"] == "Low":
-                image_obj = Image.eval(image_obj, gamma_correct_low)
-            if self._config_options["Gamma Adj"]["value"] == "Med":
-                image_obj = Image.eval(image_obj, gamma_correct_med)
-            if self._config_options["Gamma Adj"]["value"] == "High":
-                image_obj = Image.eval(image_obj, gamma_correct_high)
-
-            self.screen.paste(image_obj)
+            else:
+                image_obj = image_obj.convert("L")
+
+            _preview_pipeline(
+                np.asarray(image_obj, dtype=np.float32),
+                self._color_mask,
+                GAMMA_LUTS[self._config_options["Gamma Adj"]["value"]],
+                self._preview_rgb,
+            )
+            self.screen.paste(Image.fromarray(self._preview_rgb))
             self.last_update = last_image_time
 
             self.title = "PREVIEW"
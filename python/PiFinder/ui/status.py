@@ -103,6 +103,10 @@ class UIStatus(UIModule):
 
         self.last_temp_time = 0
         self.last_IP_time = 0
+        # status rows as last drawn
+        self._prev_lines = []
+        self._last_drawn = 0
+        self.last_update_time = 0
 
     def update_software(self, option):
         if option == "CANCEL":
@@ -237,7 +241,6 @@ class UIStatus(UIModule):
 
     def update(self, force=False):
         self.update_status_dict()
-        self.draw.rectangle([0, 0, 128, 128], fill=self.colors.get(0))
         lines = []
         for k, v in self.status_dict.items():
             line = f"{k: >7}:{v: >10}"
@@ -246,10 +249,29 @@ class UIStatus(UIModule):
         # Insert IP address here...
         lines[-1] = f'{self.status_dict["IP ADDR"]: >21}'
 
-        for i, line in enumerate(lines):
-            self.draw.text(
-                (0, i * 10 + 20), line, font=self.font_base, fill=self.colors.get(255)
-            )
+        # Only redraw the rows if one changed or a
+        # message box has been drawn over them
+        if (
+            force
+            or lines != self._prev_lines
+            or self.ui_state["message_timeout"] > self._last_drawn
+        ):
+            self.screen.paste(self._blank)
+            for i, line in enumerate(lines):
+                self.draw.text(
+                    (0, i * 10 + 20),
+                    line,
+                    font=self.font_base,
+                    fill=self.colors.get(255),
+                )
+            self._prev_lines = lines
+            self._last_drawn = time.time()
+        elif self.switch_to is None and time.time() - self.last_update_time < 1:
+            # Nothing changed, skip the update but still
+            # refresh the title bar solve/GPS status once a second
+            return None
+
+        self.last_update_time = time.time()
         return self.screen_update()
 
     def active(self):
@@ -259,3 +281,4 @@ class UIStatus(UIModule):
         """
         with open(self.wifi_txt, "r") as wfs:
             self._config_options["WiFi Mode"]["value"] = wfs.read()
+        self._prev_lines = []